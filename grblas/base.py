@@ -1,3 +1,5 @@
+import threading
+import numpy as np
 from . import lib, ffi
 from . import dtypes, ops, descriptor
 from .exceptions import check_status
@@ -9,6 +11,49 @@ NULL = ffi.NULL
 REPLACE = object()
 
 
+class _Scratch(threading.local):
+    """
+    Per-thread output arguments, reused to avoid calling ffi.new for every size/nvals query
+    Must be thread-local because cffi releases the GIL while calling into GraphBLAS
+    """
+    def __init__(self):
+        self.index = ffi.new('GrB_Index*')
+
+
+_scratch = _Scratch()
+
+
+def _index_array(indices):
+    """
+    Converts indices to a GrB_Index array for passing to GraphBLAS
+    NumPy arrays are passed via their buffer rather than element-by-element
+    and must have an integer dtype; other sequences go through ffi.new,
+    which rejects values that don't fit
+    """
+    if isinstance(indices, np.ndarray):
+        if indices.dtype.kind not in 'iu':
+            raise TypeError(f'Index array must have an integer dtype, not {indices.dtype}')
+        if indices.dtype.kind == 'i' and indices.size > 0 and indices.min() < 0:
+            raise OverflowError('Index array must not contain negative values')
+        indices = indices.astype(np.uint64, casting='same_kind', copy=False)
+        return ffi.from_buffer('GrB_Index[]', np.ascontiguousarray(indices))
+    return ffi.new('GrB_Index[]', indices)
+
+
+def _values_array(values, dtype):
+    """
+    Converts values to a C array of dtype for passing to GraphBLAS
+    NumPy arrays are passed via their buffer rather than element-by-element
+    and are only cast when the cast is "same_kind"; other sequences go through
+    ffi.new, which rejects values that don't fit
+    """
+    if isinstance(values, np.ndarray):
+        # Raises TypeError for unsafe casts (e.g. floats into an integer dtype)
+        values = values.astype(dtype.np_type, casting='same_kind', copy=False)
+        return ffi.from_buffer(f'{dtype.c_type}[]', np.ascontiguousarray(values))
+    return ffi.new(f'{dtype.c_type}[]', values)
+
+
 class GbContainer:
     def __init__(self, gb_obj, dtype):
         if not isinstance(gb_obj, ffi.CData):
@@ -99,8 +144,8 @@ class GbDelayed:
         tail_args: arguments specific to func other than the standard INOUT, mask, accum, and desc
         at: (bool) whether first input argument (A) is transposed
         bt: (bool) whether second input argument (B) is transposed
-        output_constructor: functools.partial, must be callable with no additional arguments to
-                            create an output object from GbDelayed; used when delayed.new() is called
+        output_constructor: callable with no arguments (or an optional `dtype` keyword) which
+                            creates an output object from GbDelayed; used when delayed.new() is called
         """
         self.func = func
         self.tail_args = tail_args
@@ -119,8 +164,6 @@ class GbDelayed:
         if self.output_constructor is None:
             raise Exception('output_constructor was not defined. Unable to use `new` method.')
         if dtype is not None:
-            if 'dtype' not in self.output_constructor.keywords:
-                raise Exception('output_constructor does not use `dtype`; invalid to specify for this usage')
             output = self.output_constructor(dtype=dtype)
         else:
             output = self.output_constructor()
@@ -1,34 +1,64 @@
-import re
+from functools import lru_cache
 from . import lib
 import numba
 import numpy as np
 
 
+# GraphBLAS functions specialized by type (e.g. GrB_Vector_build_INT64)
+# These are resolved once and stored as attributes on each DataType
+_typed_funcs = {
+    'vector_extractTuples': 'GrB_Vector_extractTuples',
+    'vector_build': 'GrB_Vector_build',
+    'vector_reduce': 'GrB_Vector_reduce',
+    'vector_extractElement': 'GrB_Vector_extractElement',
+    'vector_setElement': 'GrB_Vector_setElement',
+    'vector_assign': 'GrB_Vector_assign',
+    'matrix_extractTuples': 'GrB_Matrix_extractTuples',
+    'matrix_build': 'GrB_Matrix_build',
+    'matrix_reduce': 'GrB_Matrix_reduce',
+    'matrix_extractElement': 'GrB_Matrix_extractElement',
+    'matrix_setElement': 'GrB_Matrix_setElement',
+    'matrix_assign': 'GrB_Matrix_assign',
+    'monoid_new': 'GrB_Monoid_new',
+}
+
+
 class DataType:
-    __slots__ = ['name', 'gb_type', 'c_type', 'numba_type']
+    __slots__ = ['name', 'gb_type', 'c_type', 'numba_type', 'np_type', 'itemsize', 'bits', '_tag'] + list(_typed_funcs)
+    _num_types = 0
 
-    def __init__(self, name, gb_type, c_type, numba_type):
+    def __init__(self, name, gb_type, c_type, numba_type, np_type):
         self.name = name
         self.gb_type = gb_type
         self.c_type = c_type
         self.numba_type = numba_type
+        self.np_type = np_type
+        self.itemsize = np.dtype(np_type).itemsize
+        # Number of bits, e.g. 32 for INT32 or FP32 (BOOL is treated as 0 bits)
+        self.bits = 0 if name == 'BOOL' else int(''.join(c for c in name if c.isdigit()))
+        # DataTypes are singletons, so a small integer tag identifies each one
+        self._tag = DataType._num_types
+        DataType._num_types += 1
     
     def __repr__(self):
         return self.name
     
     def __hash__(self):
-        return hash((self.name, self.c_type))
+        return self._tag
     
     def __eq__(self, other):
+        return (self is other
+                or (isinstance(other, DataType) and self._tag == other._tag)
+                or self._slow_eq(other))
+
+    def _slow_eq(self, other):
         if isinstance(other, DataType):
-            return self.gb_type == other.gb_type
-        else:
-            # Attempt to use `other` as a lookup key
-            try:
-                other = lookup(other)
-                return self == other
-            except KeyError:
-                return False
+            return False
+        # Attempt to use `other` as a lookup key
+        try:
+            return self is lookup(other)
+        except KeyError:
+            return False
     
     @classmethod
     def from_pytype(cls, pytype):
@@ -41,17 +71,17 @@ class DataType:
         raise TypeError(f'Invalid pytype: {pytype}')
 
 
-BOOL = DataType('BOOL', lib.GrB_BOOL, '_Bool', numba.types.bool_)
-INT8 = DataType('INT8', lib.GrB_INT8, 'int8_t', numba.types.int8)
-UINT8 = DataType('UINT8', lib.GrB_UINT8, 'uint8_t', numba.types.uint8)
-INT16 = DataType('INT16', lib.GrB_INT16, 'int16_t', numba.types.int16)
-UINT16 = DataType('UINT16', lib.GrB_UINT16, 'uint16_t', numba.types.uint16)
-INT32 = DataType('INT32', lib.GrB_INT32, 'int32_t', numba.types.int32)
-UINT32 = DataType('UINT32', lib.GrB_UINT32, 'uint32_t', numba.types.uint32)
-INT64 = DataType('INT64', lib.GrB_INT64, 'int64_t', numba.types.int64)
-UINT64 = DataType('UINT64', lib.GrB_UINT64, 'uint64_t', numba.types.uint64)
-FP32 = DataType('FP32', lib.GrB_FP32, 'float', numba.types.float32)
-FP64 = DataType('FP64', lib.GrB_FP64, 'double', numba.types.float64)
+BOOL = DataType('BOOL', lib.GrB_BOOL, '_Bool', numba.types.bool_, np.bool_)
+INT8 = DataType('INT8', lib.GrB_INT8, 'int8_t', numba.types.int8, np.int8)
+UINT8 = DataType('UINT8', lib.GrB_UINT8, 'uint8_t', numba.types.uint8, np.uint8)
+INT16 = DataType('INT16', lib.GrB_INT16, 'int16_t', numba.types.int16, np.int16)
+UINT16 = DataType('UINT16', lib.GrB_UINT16, 'uint16_t', numba.types.uint16, np.uint16)
+INT32 = DataType('INT32', lib.GrB_INT32, 'int32_t', numba.types.int32, np.int32)
+UINT32 = DataType('UINT32', lib.GrB_UINT32, 'uint32_t', numba.types.uint32, np.uint32)
+INT64 = DataType('INT64', lib.GrB_INT64, 'int64_t', numba.types.int64, np.int64)
+UINT64 = DataType('UINT64', lib.GrB_UINT64, 'uint64_t', numba.types.uint64, np.uint64)
+FP32 = DataType('FP32', lib.GrB_FP32, 'float', numba.types.float32, np.float32)
+FP64 = DataType('FP64', lib.GrB_FP64, 'double', numba.types.float64, np.float64)
 
 # Used for testing user-defined functions
 _sample_values = {
@@ -68,7 +98,7 @@ _sample_values = {
     FP64: 3.14
 }
 
-# Create register to easily lookup types by name, gb_type, or c_type
+# Create register to easily lookup types by name, gb_type, c_type, numba type, or NumPy type
 _registry = {}
 for x in _sample_values:
     _registry[x.name] = x
@@ -76,7 +106,11 @@ for x in _sample_values:
     _registry[x.c_type] = x
     _registry[x.numba_type] = x
     _registry[x.numba_type.name] = x
-del x
+    _registry[x.np_type] = x
+    _registry[np.dtype(x.np_type)] = x
+    for attr, func_name in _typed_funcs.items():
+        setattr(x, attr, getattr(lib, f'{func_name}_{x.name}'))
+del x, attr, func_name
 # Add some common Python types as lookup keys
 _registry[int] = DataType.from_pytype(int)
 _registry[float] = DataType.from_pytype(float)
@@ -87,6 +121,11 @@ def lookup(key):
     # Check for silly lookup where key is already a DataType
     if isinstance(key, DataType):
         return key
+    return _lookup_cached(key)
+
+
+@lru_cache(maxsize=256)
+def _lookup_cached(key):
     try:
         return _registry[key]
     except KeyError:
@@ -96,18 +135,9 @@ def lookup(key):
             raise
 
 
-_bits_pattern = re.compile(r'\D+(\d+)$')
-
-
-def unify(type1, type2):
+def _unify_slow(type1, type2):
     """
-    Returns a type that can hold both type1 and type2
-
-    For example:
-    unify(INT32, INT64) -> INT64
-    unify(INT8, UINT16) -> INT32
-    unify(BOOL, UINT16) -> UINT16
-    unify(FP32, INT32) -> FP32
+    Computes the result of `unify`; only used to build `_UNIFY_TABLE`
     """
     if type1 == type2:
         return type1
@@ -117,8 +147,8 @@ def unify(type1, type2):
     if type2 == BOOL:
         return type1
     # Compute bit numbers for comparison
-    num1 = int(_bits_pattern.match(type1.name).group(1))
-    num2 = int(_bits_pattern.match(type2.name).group(1))
+    num1 = type1.bits
+    num2 = type2.bits
     # Floats anywhere requires floats
     if type1.name[0] == 'F' or type2.name[0] == 'F':
         return lookup(f'FP{max(num1, num2)}')
@@ -136,3 +166,35 @@ def unify(type1, type2):
     if maxnum > 64:
         return FP64
     return lookup(f'INT{maxnum}')
+
+
+# DataTypes ordered by their integer tag
+_TYPES_BY_CODE = tuple(sorted(_sample_values, key=lambda x: x._tag))
+_NUM_TYPES = len(_TYPES_BY_CODE)
+# There are only a handful of DataTypes, so precompute every pair once
+# Flattened table indexed by `type1._tag * _NUM_TYPES + type2._tag`
+_UNIFY_TABLE = tuple(_unify_slow(a, b) for a in _TYPES_BY_CODE for b in _TYPES_BY_CODE)
+# The same table as tags, so unification can be compiled into numba functions
+_UNIFY_TABLE_NP = np.array([x._tag for x in _UNIFY_TABLE], dtype=np.int8).reshape(_NUM_TYPES, _NUM_TYPES)
+
+
+def unify(type1, type2):
+    """
+    Returns a type that can hold both type1 and type2
+
+    For example:
+    unify(INT32, INT64) -> INT64
+    unify(INT8, UINT16) -> INT32
+    unify(BOOL, UINT16) -> UINT16
+    unify(FP32, INT32) -> FP32
+    """
+    return _UNIFY_TABLE[type1._tag * _NUM_TYPES + type2._tag]
+
+
+@numba.njit(cache=True)
+def _unify_tag(tag1, tag2):
+    """
+    Same as `unify`, but operates on DataType tags so it may be called from numba-compiled code
+    Use `_TYPES_BY_CODE` to convert the returned tag back to a DataType
+    """
+    return _UNIFY_TABLE_NP[tag1, tag2]
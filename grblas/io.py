@@ -13,12 +13,12 @@ def show(m):
     print(m)
     if isinstance(m, Matrix):
         df = pd.DataFrame(columns=range(m.ncols), index=range(m.nrows))
-        for i, j, val in zip(*m.to_values()):
+        for i, j, val in zip(*(a.tolist() for a in m.to_values())):
             df.iloc[i, j] = val
         df = df.where(pd.notnull(df), '')
     elif isinstance(m, Vector):
         df = pd.DataFrame(index=range(m.size), columns=[''])
-        for i, val in zip(*m.to_values()):
+        for i, val in zip(*(a.tolist() for a in m.to_values())):
             df.iloc[i] = val
         df = df.where(pd.notnull(df), '').T
     elif isinstance(m, Scalar):
@@ -109,7 +109,7 @@ def from_scipy_sparse_matrix(m):
 def to_networkx(m):
     import networkx as nx
     g = nx.DiGraph()
-    for row, col, val in zip(*m.to_values()):
+    for row, col, val in zip(*(a.tolist() for a in m.to_values())):
         g.add_edge(row, col, weight=val)
     return g
 
@@ -137,7 +137,7 @@ def to_scipy_sparse_matrix(m, format='csr'):
     from scipy.sparse import coo_matrix
     nrows, ncols = m.nrows, m.ncols
     rows, cols, data = m.to_values()
-    ss = coo_matrix((list(data), (list(rows), list(cols))), shape=(nrows, ncols))
+    ss = coo_matrix((data, (rows, cols)), shape=(nrows, ncols))
     format = format.lower()
     if format not in {'bsr', 'csr', 'csc', 'coo', 'lil', 'dia', 'dok'}:
         raise GrblasException(f'Invalid format: {format}')
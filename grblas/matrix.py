@@ -1,13 +1,32 @@
 import types
-from functools import partial
-from .base import lib, ffi, NULL, GbContainer, GbDelayed
-from .vector import Vector
-from .scalar import Scalar
+import numpy as np
+from .base import lib, ffi, NULL, GbContainer, GbDelayed, _scratch, _index_array, _values_array
+from .vector import Vector, _vector_constructor
+from .scalar import Scalar, _scalar_constructor
 from .ops import (OpBase, UnaryOp, BinaryOp, Monoid, Semiring,
-                  find_opclass, find_return_type)
+                  find_opclass, find_opclass_tag, find_return_type,
+                  UNARYOP_TAG, BINARYOP_TAG, MONOID_TAG, SEMIRING_TAG)
 from . import dtypes
 from .exceptions import check_status, is_error, NoValue
 
+_GrB_ALL = lib.GrB_ALL
+_SLICE_ALL = slice(None)
+# GraphBLAS functions for each opclass tag
+_ewise_add_funcs = {
+    BINARYOP_TAG: lib.GrB_eWiseAdd_Matrix_BinaryOp,
+    MONOID_TAG: lib.GrB_eWiseAdd_Matrix_Monoid,
+    SEMIRING_TAG: lib.GrB_eWiseAdd_Matrix_Semiring,
+}
+_ewise_mult_funcs = {
+    BINARYOP_TAG: lib.GrB_eWiseMult_Matrix_BinaryOp,
+    MONOID_TAG: lib.GrB_eWiseMult_Matrix_Monoid,
+    SEMIRING_TAG: lib.GrB_eWiseMult_Matrix_Semiring,
+}
+_reduce_funcs = {
+    BINARYOP_TAG: lib.GrB_Matrix_reduce_BinaryOp,
+    MONOID_TAG: lib.GrB_Matrix_reduce_Monoid,
+}
+
 
 class Matrix(GbContainer):
     """
@@ -18,9 +37,6 @@ class Matrix(GbContainer):
 
     def __init__(self, gb_obj, dtype):
         super().__init__(gb_obj, dtype)
-        self.element = Matrix.ElementManipulator(self)
-        self.extract = Matrix.Extractor(self)
-        self.assign = Matrix.Assigner(self)
 
     def __del__(self):
         check_status(lib.GrB_Matrix_free(self.gb_obj))
@@ -34,16 +50,19 @@ class Matrix(GbContainer):
             return False
         if self.dtype != other.dtype:
             return False
-        if self.nrows != other.nrows:
+        nrows = self.nrows
+        if nrows != other.nrows:
             return False
-        if self.ncols != other.ncols:
+        ncols = self.ncols
+        if ncols != other.ncols:
             return False
-        if self.nvals != other.nvals:
+        nvals = self.nvals
+        if nvals != other.nvals:
             return False
         # Use ewise_mult to compare equality via intersection
-        matches = Matrix.new_from_type(bool, self.nrows, self.ncols)
+        matches = Matrix.new_from_type(bool, nrows, ncols)
         matches[:] = self.ewise_mult(other, BinaryOp.EQ)
-        if matches.nvals != self.nvals:
+        if matches.nvals != nvals:
             return False
         # Check if all results are True
         result = Scalar.new_from_type(bool)
@@ -53,15 +72,27 @@ class Matrix(GbContainer):
     def __len__(self):
         return self.nvals
 
+    @property
+    def element(self):
+        return Matrix.ElementManipulator(self)
+
+    @property
+    def extract(self):
+        return Matrix.Extractor(self)
+
+    @property
+    def assign(self):
+        return Matrix.Assigner(self)
+
     @property
     def nrows(self):
-        n = ffi.new('GrB_Index*')
+        n = _scratch.index
         check_status(lib.GrB_Matrix_nrows(n, self.gb_obj[0]))
         return n[0]
 
     @property
     def ncols(self):
-        n = ffi.new('GrB_Index*')
+        n = _scratch.index
         check_status(lib.GrB_Matrix_ncols(n, self.gb_obj[0]))
         return n[0]
 
@@ -71,7 +102,7 @@ class Matrix(GbContainer):
 
     @property
     def nvals(self):
-        n = ffi.new('GrB_Index*')
+        n = _scratch.index
         check_status(lib.GrB_Matrix_nvals(n, self.gb_obj[0]))
         return n[0]
 
@@ -96,30 +127,32 @@ class Matrix(GbContainer):
     def to_values(self):
         """
         GrB_Matrix_extractTuples
-        Extract the rows, columns and values as 3 generators
+        Extract the rows, columns and values as 3 NumPy arrays
         """
-        rows = ffi.new('GrB_Index[]', self.nvals)
-        columns = ffi.new('GrB_Index[]', self.nvals)
-        values = ffi.new(f'{self.dtype.c_type}[]', self.nvals)
-        n = ffi.new('GrB_Index*')
-        n[0] = self.nvals
-        func = getattr(lib, f'GrB_Matrix_extractTuples_{self.dtype.name}')
+        nvals = self.nvals
+        # np.empty avoids the zero-fill of ffi.new; GraphBLAS overwrites every element
+        rows = np.empty(nvals, dtype=np.uint64)
+        columns = np.empty(nvals, dtype=np.uint64)
+        values = np.empty(nvals, dtype=self.dtype.np_type)
+        n = _scratch.index
+        n[0] = nvals
+        func = self.dtype.matrix_extractTuples
         check_status(func(
-            rows,
-            columns,
-            values,
+            ffi.from_buffer('GrB_Index[]', rows),
+            ffi.from_buffer('GrB_Index[]', columns),
+            ffi.from_buffer(f'{self.dtype.c_type}[]', values),
             n,
             self.gb_obj[0]))
-        return iter(rows), iter(columns), iter(values)
+        return rows, columns, values
 
     def rebuild_from_values(self, rows, columns, values, *, dup_op=NULL):
         # TODO: add `size` option once .resize is available
         self.clear()
-        if not isinstance(rows, (tuple, list)):
+        if not isinstance(rows, (tuple, list, np.ndarray)):
             rows = tuple(rows)
-        if not isinstance(columns, (tuple, list)):
+        if not isinstance(columns, (tuple, list, np.ndarray)):
             columns = tuple(columns)
-        if not isinstance(values, (tuple, list)):
+        if not isinstance(values, (tuple, list, np.ndarray)):
             values = tuple(values)
         n = len(values)
         if len(rows) != n or len(columns) != n:
@@ -132,11 +165,11 @@ class Matrix(GbContainer):
             dup_op = BinaryOp.PLUS
         if isinstance(dup_op, BinaryOp):
             dup_op = dup_op[self.dtype]
-        rows = ffi.new('GrB_Index[]', rows)
-        columns = ffi.new('GrB_Index[]', columns)
-        values = ffi.new(f'{self.dtype.c_type}[]', values)
+        rows = _index_array(rows)
+        columns = _index_array(columns)
+        values = _values_array(values, self.dtype)
         # Push values into w
-        func = getattr(lib, f'GrB_Matrix_build_{self.dtype.name}')
+        func = self.dtype.matrix_build
         check_status(func(
             self.gb_obj[0],
             rows,
@@ -145,7 +178,7 @@ class Matrix(GbContainer):
             n,
             dup_op))
         # Check for duplicates when dup_op was not provided
-        if dup_orig is NULL and self.nvals < len(values):
+        if dup_orig is NULL and self.nvals < n:
             raise ValueError('Duplicate indices found, must provide `dup_op` BinaryOp') 
 
     @classmethod
@@ -174,28 +207,32 @@ class Matrix(GbContainer):
         """Create a new Matrix from the given lists of row indices, column
         indices, and values.  If nrows or ncols are not provided, they
         are computed from the max row and coumn index found.
+        NumPy arrays are passed to GraphBLAS directly without conversion.
         """
-        if not isinstance(rows, (tuple, list)):
+        if not isinstance(rows, (tuple, list, np.ndarray)):
             rows = tuple(rows)
-        if not isinstance(columns, (tuple, list)):
+        if not isinstance(columns, (tuple, list, np.ndarray)):
             columns = tuple(columns)
-        if not isinstance(values, (tuple, list)):
+        if not isinstance(values, (tuple, list, np.ndarray)):
             values = tuple(values)
         if len(values) <= 0:
             raise ValueError('No values provided. Unable to determine type.')
         if dtype is None:
-            # Find dtype from any of the values (assumption is they are the same type)
-            dtype = type(values[0])
+            if isinstance(values, np.ndarray):
+                dtype = values.dtype
+            else:
+                # Find dtype from any of the values (assumption is they are the same type)
+                dtype = type(values[0])
         dtype = dtypes.lookup(dtype)
         # Compute nrows and ncols if not provided
         if nrows is None:
-            if not rows:
+            if len(rows) <= 0:
                 raise ValueError('No row indices provided. Unable to infer nrows.')
-            nrows = max(rows) + 1
+            nrows = int(rows.max()) + 1 if isinstance(rows, np.ndarray) else max(rows) + 1
         if ncols is None:
-            if not columns:
+            if len(columns) <= 0:
                 raise ValueError('No column indices provided. Unable to infer ncols.')
-            ncols = max(columns) + 1
+            ncols = int(columns.max()) + 1 if isinstance(columns, np.ndarray) else max(columns) + 1
         # Create the new matrix
         C = cls.new_from_type(dtype, nrows, ncols)
         # Add the data
@@ -219,13 +256,11 @@ class Matrix(GbContainer):
             raise TypeError(f'Expected Matrix, found {type(other)}')
         if op is NULL:
             op = BinaryOp.PLUS
-        opclass = find_opclass(op)
-        if opclass not in ('BinaryOp', 'Monoid', 'Semiring'):
+        func = _ewise_add_funcs.get(find_opclass_tag(op))
+        if func is None:
             raise TypeError(f'op must be BinaryOp, Monoid, or Semiring')
-        func = getattr(lib, f'GrB_eWiseAdd_Matrix_{opclass}')
-        output_constructor = partial(Matrix.new_from_type,
-                                     dtype=find_return_type(op, self.dtype, other.dtype),
-                                     nrows=self.nrows, ncols=self.ncols)
+        output_constructor = _matrix_constructor(find_return_type(op, self.dtype, other.dtype),
+                                                 self.nrows, self.ncols)
         return GbDelayed(func,
                          [op, self.gb_obj[0], other.gb_obj[0]],
                          at=self.is_transposed,
@@ -242,13 +277,11 @@ class Matrix(GbContainer):
             raise TypeError(f'Expected Matrix, found {type(other)}')
         if op is NULL:
             op = BinaryOp.TIMES
-        opclass = find_opclass(op)
-        if opclass not in ('BinaryOp', 'Monoid', 'Semiring'):
+        func = _ewise_mult_funcs.get(find_opclass_tag(op))
+        if func is None:
             raise TypeError(f'op must be BinaryOp, Monoid, or Semiring')
-        func = getattr(lib, f'GrB_eWiseMult_Matrix_{opclass}')
-        output_constructor = partial(Matrix.new_from_type,
-                                     dtype=find_return_type(op, self.dtype, other.dtype),
-                                     nrows=self.nrows, ncols=self.ncols)
+        output_constructor = _matrix_constructor(find_return_type(op, self.dtype, other.dtype),
+                                                 self.nrows, self.ncols)
         return GbDelayed(func,
                          [op, self.gb_obj[0], other.gb_obj[0]],
                          at=self.is_transposed,
@@ -264,12 +297,10 @@ class Matrix(GbContainer):
             raise TypeError(f'Expected Vector, found {type(other)}')
         if op is NULL:
             op = Semiring.PLUS_TIMES
-        opclass = find_opclass(op)
-        if opclass != 'Semiring':
+        if find_opclass_tag(op) != SEMIRING_TAG:
             raise TypeError(f'op must be Semiring')
-        output_constructor = partial(Vector.new_from_type,
-                                     dtype=find_return_type(op, self.dtype, other.dtype),
-                                     size=self.nrows)
+        output_constructor = _vector_constructor(find_return_type(op, self.dtype, other.dtype),
+                                                 self.nrows)
         return GbDelayed(lib.GrB_mxv,
                          [op, self.gb_obj[0], other.gb_obj[0]],
                          at=self.is_transposed,
@@ -284,12 +315,10 @@ class Matrix(GbContainer):
             raise TypeError(f'Expected Matrix or Vector, found {type(other)}')
         if op is NULL:
             op = Semiring.PLUS_TIMES
-        opclass = find_opclass(op)
-        if opclass != 'Semiring':
+        if find_opclass_tag(op) != SEMIRING_TAG:
             raise TypeError(f'op must be Semiring')
-        output_constructor = partial(Matrix.new_from_type,
-                                     dtype=find_return_type(op, self.dtype, other.dtype),
-                                     nrows=self.nrows, ncols=other.ncols)
+        output_constructor = _matrix_constructor(find_return_type(op, self.dtype, other.dtype),
+                                                 self.nrows, other.ncols)
         return GbDelayed(lib.GrB_mxm,
                          [op, self.gb_obj[0], other.gb_obj[0]],
                          at=self.is_transposed,
@@ -310,9 +339,8 @@ class Matrix(GbContainer):
         if opclass not in ('BinaryOp', 'Monoid', 'Semiring'):
             raise TypeError(f'op must be BinaryOp, Monoid, or Semiring')
         func = getattr(lib, f'GrB_kronecker_{opclass}')
-        output_constructor = partial(Matrix.new_from_type,
-                                     dtype=find_return_type(op, self.dtype, other.dtype),
-                                     nrows=self.nrows*other.nrows, ncols=self.ncols*other.ncols)
+        output_constructor = _matrix_constructor(find_return_type(op, self.dtype, other.dtype),
+                                                 self.nrows*other.nrows, self.ncols*other.ncols)
         return GbDelayed(func,
                          [op, self.gb_obj[0], other.gb_obj[0]],
                          at=self.is_transposed,
@@ -328,14 +356,14 @@ class Matrix(GbContainer):
         """
         if isinstance(op, types.FunctionType):
             op = build_udf(op, self)
-            opclass = 'UnaryOp'
+            opclass = UNARYOP_TAG
         else:
-            opclass = find_opclass(op)
+            opclass = find_opclass_tag(op)
 
-        if opclass == 'UnaryOp':
+        if opclass == UNARYOP_TAG:
             if left is not None or right is not None:
                 raise TypeError('Cannot provide `left` or `right` for a UnaryOp')
-        elif opclass == 'BinaryOp':
+        elif opclass == BINARYOP_TAG:
             if left is None and right is None:
                 raise TypeError('Must provide either `left` or `right` for a BinaryOp')
             elif left is not None and right is not None:
@@ -343,10 +371,9 @@ class Matrix(GbContainer):
         else:
             raise TypeError('apply only accepts UnaryOp or BinaryOp')
 
-        output_constructor = partial(Matrix.new_from_type,
-                                     dtype=find_return_type(op, self.dtype),
-                                     nrows=self.nrows, ncols=self.ncols)
-        if opclass == 'UnaryOp':
+        output_constructor = _matrix_constructor(find_return_type(op, self.dtype),
+                                                 self.nrows, self.ncols)
+        if opclass == UNARYOP_TAG:
             return GbDelayed(lib.GrB_Matrix_apply,
                              [op, self.gb_obj[0]],
                              output_constructor=output_constructor)
@@ -364,13 +391,10 @@ class Matrix(GbContainer):
                 op = Monoid.LOR
             else:
                 op = Monoid.PLUS
-        opclass = find_opclass(op)
-        if opclass not in ('BinaryOp', 'Monoid'):
+        func = _reduce_funcs.get(find_opclass_tag(op))
+        if func is None:
             raise TypeError(f'op must be BinaryOp or Monoid')
-        func = getattr(lib, f'GrB_Matrix_reduce_{opclass}')
-        output_constructor = partial(Vector.new_from_type,
-                                     dtype=find_return_type(op, self.dtype),
-                                     size=self.nrows)
+        output_constructor = _vector_constructor(find_return_type(op, self.dtype), self.nrows)
         return GbDelayed(func,
                          [op, self.gb_obj[0]],
                          at=self.is_transposed,
@@ -393,15 +417,16 @@ class Matrix(GbContainer):
                 op = Monoid.LOR
             else:
                 op = Monoid.PLUS
-        func = getattr(lib, f'GrB_Matrix_reduce_{self.dtype.name}')
-        output_constructor = partial(Scalar.new_from_type,
-                                     dtype=find_return_type(op, self.dtype))
+        func = self.dtype.matrix_reduce
+        output_constructor = _scalar_constructor(find_return_type(op, self.dtype))
         return GbDelayed(func,
                         [op, self.gb_obj[0]],
                         output_constructor=output_constructor)
 
 
     class ElementManipulator:
+        __slots__ = ['_matrix']
+
         def __init__(self, matrix):
             self._matrix = matrix
         
@@ -409,14 +434,15 @@ class Matrix(GbContainer):
             return 'MatrixElementManipulator'
         
         def _parse_index(self, index):
-            if (
-                not isinstance(index, tuple)
-                or len(index) != 2
-                or not isinstance(index[0], int)
-                or not isinstance(index[1], int)
-            ):
+            if not isinstance(index, tuple) or len(index) != 2:
                 raise TypeError('Index must be a 2-tuple of ints')
             row, col = index
+            if isinstance(row, np.integer):
+                row = int(row)
+            if isinstance(col, np.integer):
+                col = int(col)
+            if not isinstance(row, int) or not isinstance(col, int):
+                raise TypeError('Index must be a 2-tuple of ints')
             shape = self._matrix.shape
             if row >= shape[0]:
                 raise IndexError(f'row_index={row}, nrows={shape[0]}')
@@ -427,7 +453,7 @@ class Matrix(GbContainer):
         def __getitem__(self, index):
             row, col = self._parse_index(index)
             mat = self._matrix
-            func = getattr(lib, f'GrB_Matrix_extractElement_{mat.dtype}')
+            func = mat.dtype.matrix_extractElement
             result = ffi.new(f'{mat.dtype.c_type}*')
             err_code = func(result,
                             mat.gb_obj[0],
@@ -442,7 +468,7 @@ class Matrix(GbContainer):
         def __setitem__(self, index, value):
             row, col = self._parse_index(index)
             mat = self._matrix
-            func = getattr(lib, f'GrB_Matrix_setElement_{mat.dtype}')
+            func = mat.dtype.matrix_setElement
             check_status(func(
                 mat.gb_obj[0],
                 ffi.cast(mat.dtype.c_type, value),
@@ -454,6 +480,8 @@ class Matrix(GbContainer):
             raise NotImplementedError('Not available in GraphBLAS 1.2')
 
     class _Indexer:
+        __slots__ = []
+
         def _parse_indices(self, indices):
             """
             Returns rows, rowsize, cols, colsize
@@ -463,6 +491,11 @@ class Matrix(GbContainer):
             if type(indices) != tuple or len(indices) != 2:
                 raise TypeError('Index must be a 2-tuple')
             rows, cols = indices
+            # NumPy integer scalars (e.g. from to_values) are single indices
+            if isinstance(rows, np.integer):
+                rows = int(rows)
+            if isinstance(cols, np.integer):
+                cols = int(cols)
             rtyp, ctyp = type(rows), type(cols)
             
             if rtyp == int and ctyp == int:
@@ -479,18 +512,21 @@ class Matrix(GbContainer):
             if typ == int:
                 return index, None
             if typ == slice:
-                if index == slice(None):
+                if index == _SLICE_ALL:
                     # [:] means all indices; use special GrB_ALL indicator
-                    return lib.GrB_ALL, size
-                index = tuple(range(size)[index])
+                    return _GrB_ALL, size
+                index = np.arange(*index.indices(size))
+                return _index_array(index), len(index)
             elif typ != list:
                 try:
                     index = tuple(index)
                 except Exception:
                     raise TypeError()
-            return ffi.new('GrB_Index[]', index), len(index)
+            return _index_array(index), len(index)
 
     class Extractor(_Indexer):
+        __slots__ = ['_matrix']
+
         def __init__(self, matrix):
             self._matrix = matrix
         
@@ -504,9 +540,7 @@ class Matrix(GbContainer):
             if rowsize is None:
                 # Row-only selection; GraphBLAS doesn't have this method, so we hack it using transpose
                 row_index = rows
-                output_constructor = partial(Vector.new_from_type,
-                                             dtype=self._matrix.dtype,
-                                             size=colsize)
+                output_constructor = _vector_constructor(self._matrix.dtype, colsize)
                 return GbDelayed(lib.GrB_Col_extract,
                                  [self._matrix.gb_obj[0], cols, colsize, row_index],
                                  at=(not self._matrix.is_transposed),
@@ -514,23 +548,21 @@ class Matrix(GbContainer):
             elif colsize is None:
                 # Column-only selection
                 col_index = cols
-                output_constructor = partial(Vector.new_from_type,
-                                             dtype=self._matrix.dtype,
-                                             size=rowsize)
+                output_constructor = _vector_constructor(self._matrix.dtype, rowsize)
                 return GbDelayed(lib.GrB_Col_extract,
                                  [self._matrix.gb_obj[0], rows, rowsize, col_index],
                                  at=self._matrix.is_transposed,
                                  output_constructor=output_constructor)
             else:
-                output_constructor = partial(Matrix.new_from_type,
-                                             dtype=self._matrix.dtype,
-                                             nrows=rowsize, ncols=colsize)
+                output_constructor = _matrix_constructor(self._matrix.dtype, rowsize, colsize)
                 return GbDelayed(lib.GrB_Matrix_extract,
                                  [self._matrix.gb_obj[0], rows, rowsize, cols, colsize],
                                  at=self._matrix.is_transposed,
                                  output_constructor=output_constructor)
     
     class Assigner(_Indexer):
+        __slots__ = ['_matrix']
+
         def __init__(self, matrix):
             self._matrix = matrix
         
@@ -564,6 +596,9 @@ class Matrix(GbContainer):
 
             if isinstance(other, Scalar):
                 other = other.value
+            elif isinstance(other, np.generic):
+                # NumPy scalars (e.g. from to_values) become Python scalars
+                other = other.item()
 
             if isinstance(other, (int, float, bool)):
                 if rowsize is None:
@@ -574,7 +609,7 @@ class Matrix(GbContainer):
                     colsize = 1
                 dtype = self._matrix.dtype
                 scalar = ffi.cast(dtype.c_type, other)
-                func = getattr(lib, f'GrB_Matrix_assign_{dtype.name}')
+                func = dtype.matrix_assign
                 dval = GbDelayed(func,
                                  [scalar, rows, rowsize, cols, colsize])
             else:
@@ -607,9 +642,6 @@ class TransposedMatrix(Matrix):
     def __init__(self, matrix):
         super().__init__(matrix.gb_obj, matrix.dtype)
         self._matrix = matrix
-        # Remove items that aren't allowed to be accessed post-transpose
-        del self.element
-        del self.assign
     
     # Override the default behavior. Don't free gb_obj 
     # because it's shared with the untransposed matrix
@@ -636,6 +668,15 @@ class TransposedMatrix(Matrix):
     def ncols(self):
         return super().nrows
 
+    # Element access and assignment aren't allowed post-transpose
+    @property
+    def element(self):
+        raise AttributeError("'TransposedMatrix' object has no attribute 'element'")
+
+    @property
+    def assign(self):
+        raise AttributeError("'TransposedMatrix' object has no attribute 'assign'")
+
     @property
     def T(self):
         return self._matrix
@@ -659,3 +700,15 @@ class TransposedMatrix(Matrix):
     def to_values(self):
         rows, cols, vals = super().to_values()
         return cols, rows, vals
+
+
+def _matrix_constructor(dtype, nrows, ncols):
+    """
+    Returns a function which creates a new empty Matrix, for use as GbDelayed.output_constructor
+    """
+    def output_constructor(dtype=dtype):
+        dtype = dtypes.lookup(dtype)
+        new_matrix = ffi.new('GrB_Matrix*')
+        check_status(lib.GrB_Matrix_new(new_matrix, dtype.gb_type, nrows, ncols))
+        return Matrix(new_matrix, dtype)
+    return output_constructor
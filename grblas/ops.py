@@ -1,5 +1,6 @@
 import re
 import numba
+from functools import lru_cache
 from types import FunctionType
 from . import lib, ffi
 from . import dtypes
@@ -8,6 +9,13 @@ from .exceptions import check_status, GrblasException
 
 UNKNOWN_OPCLASS = 'UnknownOpClass'
 
+# Integer tags for each opclass; cheaper to compare than opclass names in hot paths
+UNKNOWN_OPCLASS_TAG = 0
+BINARYOP_TAG = 1
+MONOID_TAG = 2
+SEMIRING_TAG = 3
+UNARYOP_TAG = 4
+
 
 class UdfParseError(GrblasException):
     pass
@@ -16,6 +24,7 @@ class UdfParseError(GrblasException):
 class OpBase:
     _parse_config = None
     _initialized = False
+    _opclass_tag = UNKNOWN_OPCLASS_TAG
 
     def __init__(self, name):
         self.name = name
@@ -84,6 +93,7 @@ class OpBase:
 
 
 class UnaryOp(OpBase):
+    _opclass_tag = UNARYOP_TAG
     _parse_config = {
         'trim_from_front': 4, 
         'num_underscores': 1,
@@ -139,6 +149,7 @@ class UnaryOp(OpBase):
 
 
 class BinaryOp(OpBase):
+    _opclass_tag = BINARYOP_TAG
     _parse_config = {
         'trim_from_front': 4, 
         'num_underscores': 1,
@@ -199,6 +210,7 @@ class BinaryOp(OpBase):
 
 
 class Monoid(OpBase):
+    _opclass_tag = MONOID_TAG
     _parse_config = {
         'trim_from_front': 4,
         'trim_from_back': 7, 
@@ -217,7 +229,7 @@ class Monoid(OpBase):
         for type_ in binaryop.types:
             type_ = dtypes.lookup(type_)
             new_monoid = ffi.new('GrB_Monoid*')
-            func = getattr(lib, f'GrB_Monoid_new_{type_.name}')
+            func = type_.monoid_new
             zcast = ffi.cast(type_.c_type, zero)
             func(new_monoid, binaryop[type_], zcast)
             new_type_obj[type_.name] = new_monoid[0]
@@ -227,6 +239,7 @@ class Monoid(OpBase):
 
 
 class Semiring(OpBase):
+    _opclass_tag = SEMIRING_TAG
     _parse_config = {
         'trim_from_front': 4, 
         'num_underscores': 2,
@@ -267,8 +280,28 @@ def find_opclass(gb_op):
     return UNKNOWN_OPCLASS
 
 
+_opclass_tags = {
+    'UnaryOp': UNARYOP_TAG,
+    'BinaryOp': BINARYOP_TAG,
+    'Monoid': MONOID_TAG,
+    'Semiring': SEMIRING_TAG,
+    UNKNOWN_OPCLASS: UNKNOWN_OPCLASS_TAG,
+}
+
+
+def find_opclass_tag(gb_op):
+    """
+    Same as `find_opclass`, but returns one of the integer *_TAG constants
+    """
+    if isinstance(gb_op, OpBase):
+        return gb_op._opclass_tag
+    return _opclass_tags[find_opclass(gb_op)]
+
+
 _return_type = {}
 
+# Delayed methods call this with the same few (op, dtype) combinations over and over
+@lru_cache(maxsize=1024)
 def find_return_type(gb_op, dtype, dtype2=None):
     if dtype2 is not None:
         dtype = dtypes.unify(dtype, dtype2)
@@ -72,3 +72,12 @@ class Scalar(GbContainer):
         new_scalar = cls.new_from_type(dtype)
         new_scalar.value = value
         return new_scalar
+
+
+def _scalar_constructor(dtype):
+    """
+    Returns a function which creates a new empty Scalar, for use as GbDelayed.output_constructor
+    """
+    def output_constructor(dtype=dtype):
+        return Scalar.new_from_type(dtype)
+    return output_constructor
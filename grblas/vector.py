@@ -1,12 +1,29 @@
 import types
-from functools import partial
-from .base import lib, ffi, NULL, GbContainer, GbDelayed
-from .scalar import Scalar
+import numpy as np
+from .base import lib, ffi, NULL, GbContainer, GbDelayed, _scratch, _index_array, _values_array
+from .scalar import Scalar, _scalar_constructor
 from .ops import (OpBase, UnaryOp, BinaryOp, Monoid, Semiring,
-                  find_opclass, find_return_type)
+                  find_opclass_tag, find_return_type,
+                  UNARYOP_TAG, BINARYOP_TAG, MONOID_TAG, SEMIRING_TAG)
 from . import dtypes
 from .exceptions import check_status, is_error, NoValue
 
+_GrB_ALL = lib.GrB_ALL
+_SLICE_ALL = slice(None)
+# GraphBLAS functions for each opclass tag
+_ewise_add_funcs = {
+    BINARYOP_TAG: lib.GrB_eWiseAdd_Vector_BinaryOp,
+    MONOID_TAG: lib.GrB_eWiseAdd_Vector_Monoid,
+    SEMIRING_TAG: lib.GrB_eWiseAdd_Vector_Semiring,
+}
+_ewise_mult_funcs = {
+    BINARYOP_TAG: lib.GrB_eWiseMult_Vector_BinaryOp,
+    MONOID_TAG: lib.GrB_eWiseMult_Vector_Monoid,
+    SEMIRING_TAG: lib.GrB_eWiseMult_Vector_Semiring,
+}
+# Vectors with fewer values than this are compared in NumPy rather than GraphBLAS
+_EQ_SMALL_NVALS = 1024
+
 
 class Vector(GbContainer):
     """
@@ -17,9 +34,6 @@ class Vector(GbContainer):
 
     def __init__(self, gb_obj, dtype):
         super().__init__(gb_obj, dtype)
-        self.element = Vector.ElementManipulator(self)
-        self.extract = Vector.Extractor(self)
-        self.assign = Vector.Assigner(self)
 
     def __del__(self):
         check_status(lib.GrB_Vector_free(self.gb_obj))
@@ -28,31 +42,69 @@ class Vector(GbContainer):
         return f'<Vector {self.nvals}/{self.size}:{self.dtype.name}>'
 
     def __eq__(self, other):
+        if self is other:
+            return True
         # Borrowed this recipe from LAGraph
         if type(other) != self.__class__:
             return False
         if self.dtype != other.dtype:
             return False
-        if self.size != other.size:
+        size = self.size
+        if size != other.size:
             return False
-        if self.nvals != other.nvals:
+        nvals = self.nvals
+        if nvals != other.nvals:
             return False
-        # Use ewise_mult to compare equality via intersection
-        matches = Vector.new_from_type(bool, self.size)
-        matches[:] = self.ewise_mult(other, BinaryOp.EQ)
-        if matches.nvals != self.nvals:
+        if nvals < _EQ_SMALL_NVALS:
+            # Small vectors are cheaper to compare directly in NumPy
+            indices, values = self.to_values()
+            other_indices, other_values = other.to_values()
+            return bool(np.array_equal(indices, other_indices) and np.array_equal(values, other_values))
+        # Use ewise_mult to compare equality via intersection, then reduce with LAND.
+        # GraphBLAS is called directly to avoid the GbDelayed machinery between the
+        # two steps; a non-blocking backend may also fuse them.
+        matches = Vector.new_from_type(dtypes.BOOL, size)
+        check_status(lib.GrB_eWiseMult_Vector_BinaryOp(
+            matches.gb_obj[0],
+            NULL,
+            NULL,
+            BinaryOp.EQ[self.dtype],
+            self.gb_obj[0],
+            other.gb_obj[0],
+            NULL))
+        if matches.nvals != nvals:
             return False
         # Check if all results are True
-        result = Scalar.new_from_type(bool)
-        result[:] = matches.reduce(Monoid.LAND)
-        return result.value
+        result = ffi.new('_Bool*')
+        check_status(dtypes.BOOL.vector_reduce(
+            result,
+            NULL,
+            Monoid.LAND[dtypes.BOOL],
+            matches.gb_obj[0],
+            NULL))
+        return result[0]
 
     def __len__(self):
         return self.nvals
 
+    # The helper objects are created on access rather than stored on the Vector.
+    # Storing them would create a reference cycle, delaying `__del__` until the
+    # garbage collector runs.
+    @property
+    def element(self):
+        return Vector.ElementManipulator(self)
+
+    @property
+    def extract(self):
+        return Vector.Extractor(self)
+
+    @property
+    def assign(self):
+        return Vector.Assigner(self)
+
     @property
     def size(self):
-        n = ffi.new('GrB_Index*')
+        n = _scratch.index
         check_status(lib.GrB_Vector_size(n, self.gb_obj[0]))
         return n[0]
 
@@ -62,7 +114,7 @@ class Vector(GbContainer):
 
     @property
     def nvals(self):
-        n = ffi.new('GrB_Index*')
+        n = _scratch.index
         check_status(lib.GrB_Vector_nvals(n, self.gb_obj[0]))
         return n[0]
 
@@ -76,26 +128,28 @@ class Vector(GbContainer):
     def to_values(self):
         """
         GrB_Vector_extractTuples
-        Extract the indices and values as 2 generators
+        Extract the indices and values as 2 NumPy arrays
         """
-        indices = ffi.new('GrB_Index[]', self.nvals)
-        values = ffi.new(f'{self.dtype.c_type}[]', self.nvals)
-        n = ffi.new('GrB_Index*')
-        n[0] = self.nvals
-        func = getattr(lib, f'GrB_Vector_extractTuples_{self.dtype.name}')
+        nvals = self.nvals
+        # np.empty avoids the zero-fill of ffi.new; GraphBLAS overwrites every element
+        indices = np.empty(nvals, dtype=np.uint64)
+        values = np.empty(nvals, dtype=self.dtype.np_type)
+        n = _scratch.index
+        n[0] = nvals
+        func = self.dtype.vector_extractTuples
         check_status(func(
-            indices,
-            values,
+            ffi.from_buffer('GrB_Index[]', indices),
+            ffi.from_buffer(f'{self.dtype.c_type}[]', values),
             n,
             self.gb_obj[0]))
-        return (iter(indices), iter(values))
+        return indices, values
 
     def rebuild_from_values(self, indices, values, *, dup_op=NULL):
         # TODO: add `size` option once .resize is available
         self.clear()
-        if not isinstance(indices, (tuple, list)):
+        if not isinstance(indices, (tuple, list, np.ndarray)):
             indices = tuple(indices)
-        if not isinstance(values, (tuple, list)):
+        if not isinstance(values, (tuple, list, np.ndarray)):
             values = tuple(values)
         if len(indices) != len(values):
             raise ValueError(f'`indices` and `values` have different lengths '
@@ -108,10 +162,10 @@ class Vector(GbContainer):
             dup_op = BinaryOp.PLUS
         if isinstance(dup_op, BinaryOp):
             dup_op = dup_op[self.dtype]
-        indices = ffi.new('GrB_Index[]', indices)
-        values = ffi.new(f'{self.dtype.c_type}[]', values)
+        indices = _index_array(indices)
+        values = _values_array(values, self.dtype)
         # Push values into w
-        func = getattr(lib, f'GrB_Vector_build_{self.dtype.name}')
+        func = self.dtype.vector_build
         check_status(func(
             self.gb_obj[0],
             indices,
@@ -119,9 +173,24 @@ class Vector(GbContainer):
             n,
             dup_op))
         # Check for duplicates when dup_op was not provided
-        if dup_orig is NULL and self.nvals < len(values):
+        if dup_orig is NULL and self.nvals < n:
             raise ValueError('Duplicate indices found, must provide `dup_op` BinaryOp') 
 
+    def bulk_assign(self, indices, values, *, dup_op=NULL):
+        """
+        Assign many values at once: w[indices[k]] = values[k]
+        Values at other indices are left unchanged.
+
+        This uses a single GrB_Vector_build call, so it is much faster than
+        setting elements one at a time in a loop.  To assign the same scalar
+        to many indices, use `w.assign[indices] = value`.
+        NumPy arrays are passed to GraphBLAS directly without conversion.
+        """
+        new_values = Vector.new_from_type(self.dtype, self.size)
+        new_values.rebuild_from_values(indices, values, dup_op=dup_op)
+        # SECOND as accum takes the new value wherever one is given and keeps the rest
+        self[BinaryOp.SECOND] = new_values
+
     @classmethod
     def new_from_type(cls, dtype, size=0):
         """
@@ -147,22 +216,29 @@ class Vector(GbContainer):
     def new_from_values(cls, indices, values, *, size=None, dup_op=NULL, dtype=None):
         """Create a new Vector from the given lists of indices and values.  If
         size is not provided, it is computed from the max index found.
+        NumPy arrays are passed to GraphBLAS directly without conversion.
         """
-        if not isinstance(indices, (tuple, list)):
+        if not isinstance(indices, (tuple, list, np.ndarray)):
             indices = tuple(indices)
-        if not isinstance(values, (tuple, list)):
+        if not isinstance(values, (tuple, list, np.ndarray)):
             values = tuple(values)
         if len(values) <= 0:
             raise ValueError('No values provided. Unable to determine type.')
         if dtype is None:
-            # Find dtype from any of the values (assumption is they are the same type)
-            dtype = type(values[0])
+            if isinstance(values, np.ndarray):
+                dtype = values.dtype
+            else:
+                # Find dtype from any of the values (assumption is they are the same type)
+                dtype = type(values[0])
         dtype = dtypes.lookup(dtype)
         # Compute size if not provided
         if size is None:
-            if not indices:
+            if len(indices) <= 0:
                 raise ValueError('No indices provided. Unable to infer size.')
-            size = max(indices) + 1
+            if isinstance(indices, np.ndarray):
+                size = int(indices.max()) + 1
+            else:
+                size = max(indices) + 1
         # Create the new vector
         w = cls.new_from_type(dtype, size)
         # Add the data
@@ -186,13 +262,11 @@ class Vector(GbContainer):
             raise TypeError(f'Expected Vector, found {type(other)}')
         if op is NULL:
             op = BinaryOp.PLUS
-        opclass = find_opclass(op)
-        if opclass not in ('BinaryOp', 'Monoid', 'Semiring'):
+        func = _ewise_add_funcs.get(find_opclass_tag(op))
+        if func is None:
             raise TypeError(f'op must be BinaryOp, Monoid, or Semiring')
-        func = getattr(lib, f'GrB_eWiseAdd_Vector_{opclass}')
-        output_constructor = partial(Vector.new_from_type,
-                                     dtype=find_return_type(op, self.dtype, other.dtype),
-                                     size=self.size)
+        output_constructor = _vector_constructor(find_return_type(op, self.dtype, other.dtype),
+                                                 self.size)
         return GbDelayed(func,
                          [op, self.gb_obj[0], other.gb_obj[0]],
                          output_constructor=output_constructor)
@@ -207,13 +281,11 @@ class Vector(GbContainer):
             raise TypeError(f'Expected Vector, found {type(other)}')
         if op is NULL:
             op = BinaryOp.TIMES
-        opclass = find_opclass(op)
-        if opclass not in ('BinaryOp', 'Monoid', 'Semiring'):
+        func = _ewise_mult_funcs.get(find_opclass_tag(op))
+        if func is None:
             raise TypeError(f'op must be BinaryOp, Monoid, or Semiring')
-        func = getattr(lib, f'GrB_eWiseMult_Vector_{opclass}')
-        output_constructor = partial(Vector.new_from_type,
-                                     dtype=find_return_type(op, self.dtype, other.dtype),
-                                     size=self.size)
+        output_constructor = _vector_constructor(find_return_type(op, self.dtype, other.dtype),
+                                                 self.size)
         return GbDelayed(func,
                          [op, self.gb_obj[0], other.gb_obj[0]],
                          output_constructor=output_constructor)
@@ -228,12 +300,10 @@ class Vector(GbContainer):
             raise TypeError(f'Expected Matrix, found {type(other)}')
         if op is NULL:
             op = Semiring.PLUS_TIMES
-        opclass = find_opclass(op)
-        if opclass != 'Semiring':
+        if find_opclass_tag(op) != SEMIRING_TAG:
             raise TypeError(f'op must be Semiring')
-        output_constructor = partial(Vector.new_from_type,
-                                     dtype=find_return_type(op, self.dtype, other.dtype),
-                                     size=other.ncols)
+        output_constructor = _vector_constructor(find_return_type(op, self.dtype, other.dtype),
+                                                 other.ncols)
         return GbDelayed(lib.GrB_vxm,
                          [op, self.gb_obj[0], other.gb_obj[0]],
                          bt=other.is_transposed,
@@ -246,21 +316,19 @@ class Vector(GbContainer):
         A BinaryOp can also be applied if a scalar is passed in as `left` or `right`,
             effectively converting a BinaryOp into a UnaryOp
         """
-        opclass = find_opclass(op)
-        if opclass == 'UnaryOp':
+        opclass = find_opclass_tag(op)
+        if opclass == UNARYOP_TAG:
             if left is not None or right is not None:
                 raise TypeError('Cannot provide `left` or `right` for a UnaryOp')
-        elif opclass == 'BinaryOp':
+        elif opclass == BINARYOP_TAG:
             if left is None and right is None:
                 raise TypeError('Must provide either `left` or `right` for a BinaryOp')
             elif left is not None and right is not None:
                 raise TypeError('Cannot provide both `left` and `right`')
         else:
             raise TypeError('apply only accepts UnaryOp or BinaryOp')
-        output_constructor = partial(Vector.new_from_type,
-                                     dtype=find_return_type(op, self.dtype),
-                                     size=self.size)
-        if opclass == 'UnaryOp':
+        output_constructor = _vector_constructor(find_return_type(op, self.dtype), self.size)
+        if opclass == UNARYOP_TAG:
             return GbDelayed(lib.GrB_Vector_apply,
                              [op, self.gb_obj[0]],
                              output_constructor=output_constructor)
@@ -278,14 +346,15 @@ class Vector(GbContainer):
                 op = Monoid.LOR
             else:
                 op = Monoid.PLUS
-        func = getattr(lib, f'GrB_Vector_reduce_{self.dtype.name}')
-        output_constructor = partial(Scalar.new_from_type,
-                                     dtype=find_return_type(op, self.dtype))
+        func = self.dtype.vector_reduce
+        output_constructor = _scalar_constructor(find_return_type(op, self.dtype))
         return GbDelayed(func,
                         [op, self.gb_obj[0]],
                         output_constructor=output_constructor)
 
     class ElementManipulator:
+        __slots__ = ['_vector']
+
         def __init__(self, vector):
             self._vector = vector
         
@@ -293,7 +362,9 @@ class Vector(GbContainer):
             return 'VectorElementManipulator'
         
         def _parse_index(self, index):
-            if not isinstance(index, int):
+            if isinstance(index, np.integer):
+                index = int(index)
+            elif not isinstance(index, int):
                 raise TypeError('Index must be an int')
             size = self._vector.size
             if index >= size:
@@ -303,7 +374,7 @@ class Vector(GbContainer):
         def __getitem__(self, index):
             index = self._parse_index(index)
             vec = self._vector
-            func = getattr(lib, f'GrB_Vector_extractElement_{vec.dtype}')
+            func = vec.dtype.vector_extractElement
             result = ffi.new(f'{vec.dtype.c_type}*')
 
             err_code = func(result,
@@ -318,7 +389,7 @@ class Vector(GbContainer):
         def __setitem__(self, index, value):
             index = self._parse_index(index)
             vec = self._vector
-            func = getattr(lib, f'GrB_Vector_setElement_{vec.dtype}')
+            func = vec.dtype.vector_setElement
             check_status(func(
                 vec.gb_obj[0],
                 ffi.cast(vec.dtype.c_type, value),
@@ -329,26 +400,14 @@ class Vector(GbContainer):
             raise NotImplementedError('Not available in GraphBLAS 1.2')
 
     class _Indexer:
+        __slots__ = []
+
         def _parse_index(self, index):
-            typ = type(index)
-            if typ == int:
-                # Single index
-                return index, None
-            if typ == tuple:
-                raise TypeError(f'{self} cannot accept a tuple as index; use slice or list')
-            if typ == slice:
-                if index == slice(None):
-                    # [:] means all indices; use special GrB_ALL indicator
-                    return lib.GrB_ALL, self._vector.size
-                index = tuple(range(self._vector.size)[index])
-            elif typ != list:
-                try:
-                    index = tuple(index)
-                except Exception:
-                    raise TypeError()
-            return ffi.new('GrB_Index[]', index), len(index)
+            return _INDEX_DISPATCH.get(type(index), _parse_iterable)(self, index)
 
     class Extractor(_Indexer):
+        __slots__ = ['_vector']
+
         def __init__(self, vector):
             self._vector = vector
         
@@ -359,14 +418,14 @@ class Vector(GbContainer):
             index, isize = self._parse_index(index)
             if isize is None:
                 raise TypeError('Use v.element[i] to get a single element')
-            output_constructor = partial(Vector.new_from_type,
-                                         dtype=self._vector.dtype,
-                                         size=isize)
+            output_constructor = _vector_constructor(self._vector.dtype, isize)
             return GbDelayed(lib.GrB_Vector_extract,
                             [self._vector.gb_obj[0], index, isize],
                             output_constructor=output_constructor)
     
     class Assigner(_Indexer):
+        __slots__ = ['_vector']
+
         def __init__(self, vector):
             self._vector = vector
         
@@ -400,12 +459,16 @@ class Vector(GbContainer):
 
             if isinstance(other, Scalar):
                 other = other.value
+            elif isinstance(other, np.generic):
+                # NumPy scalars (e.g. from to_values) become Python scalars
+                other = other.item()
 
             if isinstance(other, (int, float, bool)):
                 dtype = self._vector.dtype
-                func = getattr(lib, f'GrB_Vector_assign_{dtype.name}')
+                # The scalar is passed by value and the call is delayed, so it must be
+                # converted here rather than written into a reusable buffer
                 scalar = ffi.cast(dtype.c_type, other)
-                dval = GbDelayed(func,
+                dval = GbDelayed(dtype.vector_assign,
                                  [scalar, index, isize])
             elif isinstance(other, Vector):
                 dval = GbDelayed(lib.GrB_Vector_assign,
@@ -414,3 +477,58 @@ class Vector(GbContainer):
                 raise TypeError(f'Unexpected type for assignment value: {type(other)}')
             # Forward the __setitem__ call so it is resolved with mask and accum
             self._vector[keys] = dval
+
+
+# Index parsers for Vector._Indexer, dispatched on the type of the index
+# Each returns (index, size), where size is None for a single index
+def _parse_int(indexer, index):
+    return index, None
+
+
+def _parse_tuple(indexer, index):
+    raise TypeError(f'{indexer} cannot accept a tuple as index; use slice or list')
+
+
+def _parse_slice(indexer, index):
+    size = indexer._vector.size
+    if index == _SLICE_ALL:
+        # [:] means all indices; use special GrB_ALL indicator
+        return _GrB_ALL, size
+    index = np.arange(*index.indices(size))
+    return _index_array(index), len(index)
+
+
+def _parse_array(indexer, index):
+    return _index_array(index), len(index)
+
+
+def _parse_iterable(indexer, index):
+    if isinstance(index, np.integer):
+        # NumPy integer scalars (e.g. from to_values) are single indices
+        return int(index), None
+    try:
+        index = tuple(index)
+    except Exception:
+        raise TypeError()
+    return _index_array(index), len(index)
+
+
+_INDEX_DISPATCH = {
+    int: _parse_int,
+    tuple: _parse_tuple,
+    slice: _parse_slice,
+    list: _parse_array,
+    np.ndarray: _parse_array,
+}
+
+
+def _vector_constructor(dtype, size):
+    """
+    Returns a function which creates a new empty Vector, for use as GbDelayed.output_constructor
+    """
+    def output_constructor(dtype=dtype):
+        dtype = dtypes.lookup(dtype)
+        new_vector = ffi.new('GrB_Vector*')
+        check_status(lib.GrB_Vector_new(new_vector, dtype.gb_type, size))
+        return Vector(new_vector, dtype)
+    return output_constructor
@@ -8,6 +8,6 @@ setup(
     packages=['grblas', 'grblas/backends', 'grblas/backends/suitesparse'],
     setup_requires=["cffi>=1.0.0", "pytest-runner"],
     cffi_modules=["grblas/backends/suitesparse/build.py:ffibuilder"],
-    install_requires=["cffi>=1.0.0"],
+    install_requires=["cffi>=1.12.0"],
     tests_require=["pytest"],
 )
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from grblas import dtypes, lib
 
 all_dtypes = (
@@ -41,6 +42,15 @@ def test_ctype():
     assert dtypes.FP32.c_type == 'float'
     assert dtypes.FP64.c_type == 'double'
 
+def test_bits():
+    assert dtypes.BOOL.bits == 0
+    assert dtypes.INT8.bits == 8
+    assert dtypes.UINT16.bits == 16
+    assert dtypes.INT32.bits == 32
+    assert dtypes.UINT64.bits == 64
+    assert dtypes.FP32.bits == 32
+    assert dtypes.FP64.bits == 64
+
 def test_gbtype():
     assert dtypes.BOOL.gb_type == lib.GrB_BOOL
     assert dtypes.INT8.gb_type == lib.GrB_INT8
@@ -71,6 +81,22 @@ def test_lookup_by_dtype():
     assert dtypes.lookup(int) == dtypes.INT64
     assert dtypes.lookup(float) == dtypes.FP64
 
+def test_lookup_by_numpy():
+    for dt in all_dtypes:
+        assert dtypes.lookup(dt.np_type) is dt
+        assert dtypes.lookup(np.dtype(dt.np_type)) is dt
+
+def test_np_type():
+    assert dtypes.BOOL.np_type is np.bool_
+    assert dtypes.INT8.np_type is np.int8
+    assert dtypes.UINT32.np_type is np.uint32
+    assert dtypes.FP64.np_type is np.float64
+    for dt in all_dtypes:
+        assert dt.itemsize == np.dtype(dt.np_type).itemsize
+    assert dtypes.BOOL.itemsize == 1
+    assert dtypes.INT16.itemsize == 2
+    assert dtypes.FP64.itemsize == 8
+
 def test_unify_dtypes():
     assert dtypes.unify(dtypes.BOOL, dtypes.BOOL) == dtypes.BOOL
     assert dtypes.unify(dtypes.BOOL, dtypes.INT16) == dtypes.INT16
@@ -82,3 +108,9 @@ def test_unify_dtypes():
     assert dtypes.unify(dtypes.FP64, dtypes.FP32) == dtypes.FP64
     assert dtypes.unify(dtypes.INT16, dtypes.UINT16) == dtypes.INT32
     assert dtypes.unify(dtypes.UINT64, dtypes.INT8) == dtypes.FP64
+
+def test_unify_tag_matches_unify():
+    for dt1 in all_dtypes:
+        for dt2 in all_dtypes:
+            tag = dtypes._unify_tag(dt1._tag, dt2._tag)
+            assert dtypes._TYPES_BY_CODE[tag] is dtypes.unify(dt1, dt2)
@@ -0,0 +1,14 @@
+import pytest
+from grblas import Matrix
+from grblas import io
+
+
+def test_to_networkx():
+    nx = pytest.importorskip('networkx')
+    A = Matrix.new_from_values([0, 1, 2], [1, 2, 0], [5, 6, 7])
+    g = io.to_networkx(A)
+    assert isinstance(g, nx.DiGraph)
+    assert sorted(g.edges(data='weight')) == [(0, 1, 5), (1, 2, 6), (2, 0, 7)]
+    # Nodes and weights are Python ints, not NumPy scalars
+    assert all(type(node) is int for node in g.nodes)
+    assert all(type(w) is int for _, _, w in g.edges(data='weight'))
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from grblas import lib, ffi
 from grblas import Matrix, Vector, Scalar
 from grblas import UnaryOp, BinaryOp, Monoid, Semiring
@@ -66,6 +67,14 @@ def test_new_from_values():
         # Specified ncols can't hold provided indexes
         Matrix.new_from_values([0, 1, 3], [1, 1, 2], [12.3, 12.4, 12.5], nrows=17, ncols=2)
 
+def test_new_from_values_numpy():
+    C = Matrix.new_from_values(np.array([0, 1, 3]), np.array([1, 1, 2]), np.array([1.5, 2.5, 3.5]))
+    assert C.nrows == 4
+    assert C.ncols == 3
+    assert C.nvals == 3
+    assert C.dtype == float
+    assert C.element[3, 2] == 3.5
+
 def test_clear(A):
     A.clear()
     assert A.nvals == 0
@@ -96,6 +105,31 @@ def test_extract_values(A):
     assert tuple(rows) == (0,0,1,1,2,3,3,4,5,6,6,6)
     assert tuple(cols) == (1,3,4,6,5,0,2,5,2,2,3,4)
     assert tuple(vals) == (2,3,8,4,1,3,3,7,1,5,7,3)
+    assert rows.dtype == np.uint64
+    assert vals.dtype == np.int64
+
+def test_extract_values_roundtrip(A):
+    # NumPy scalars from to_values are accepted as indices and values
+    rows, cols, vals = A.to_values()
+    assert A.element[rows[2], cols[2]] == 8
+    w = A.extract[:, cols[4]].new()
+    assert w == Vector.new_from_values([2, 4], [1, 7], size=7)
+    A.assign[rows[0], cols[0]] = vals[2]
+    assert A.element[0, 1] == 8
+    A.assign[:, cols[0]] = np.int64(9)
+    assert A.element[6, 1] == 9
+
+def test_freed_without_gc():
+    # Helper objects must not create a reference cycle with the Matrix
+    import weakref
+    B = Matrix.new_from_type(dtypes.INT64, 2, 2)
+    B.element[0, 0] = 1
+    B.assign[1, 1] = 2
+    B2 = B.extract[[0, 1], [0, 1]].new()
+    ref = weakref.ref(B)
+    del B
+    assert ref() is None
+    assert B2.nvals == 2
 
 def test_extract_element(A):
     assert A.element[3, 0] == 3
@@ -40,6 +40,17 @@ def test_find_opclass_invalid():
     assert ops.find_opclass('foobar') == ops.UNKNOWN_OPCLASS
     assert ops.find_opclass(lib.GrB_INP0) == ops.UNKNOWN_OPCLASS
 
+def test_find_opclass_tag():
+    assert ops.find_opclass_tag(UnaryOp.MINV) == ops.UNARYOP_TAG
+    assert ops.find_opclass_tag(lib.GrB_MINV_INT64) == ops.UNARYOP_TAG
+    assert ops.find_opclass_tag(BinaryOp.TIMES) == ops.BINARYOP_TAG
+    assert ops.find_opclass_tag(lib.GrB_TIMES_INT64) == ops.BINARYOP_TAG
+    assert ops.find_opclass_tag(Monoid.MAX) == ops.MONOID_TAG
+    assert ops.find_opclass_tag(lib.GxB_MAX_INT64_MONOID) == ops.MONOID_TAG
+    assert ops.find_opclass_tag(Semiring.PLUS_PLUS) == ops.SEMIRING_TAG
+    assert ops.find_opclass_tag(lib.GxB_PLUS_PLUS_INT64) == ops.SEMIRING_TAG
+    assert ops.find_opclass_tag('foobar') == ops.UNKNOWN_OPCLASS_TAG
+
 def test_unaryop_udf():
     def plus_one(x):
         return x + 1
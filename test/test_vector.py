@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from grblas import lib, ffi
 from grblas import Matrix, Vector, Scalar
 from grblas import UnaryOp, BinaryOp, Monoid, Semiring
@@ -57,6 +58,29 @@ def test_new_from_values():
     with pytest.raises(ValueError):
         # Duplicate indices requires a dup_op
         Vector.new_from_values([0, 1, 1], [True, True, True])
+    with pytest.raises(TypeError):
+        # Values are not silently truncated to the inferred dtype
+        Vector.new_from_values([0, 1], [1, 2.5])
+    with pytest.raises(TypeError):
+        Vector.new_from_values([0, 1.7], [1, 2], size=3)
+
+def test_new_from_values_numpy():
+    u = Vector.new_from_values(np.array([0, 1, 3]), np.array([1.5, 2.5, 3.5]))
+    assert u.size == 4
+    assert u.nvals == 3
+    assert u.dtype == float
+    assert u.element[3] == 3.5
+    u2 = Vector.new_from_values(np.array([0, 2], dtype=np.int32), np.array([1, 2], dtype=np.int8), size=5)
+    assert u2.size == 5
+    assert u2.dtype == dtypes.INT8
+    assert u2 == Vector.new_from_values([0, 2], [1, 2], size=5, dtype=dtypes.INT8)
+    with pytest.raises(TypeError):
+        # Values are not silently truncated to the requested dtype
+        Vector.new_from_values(np.array([0, 1]), np.array([1.5, 2.5]), dtype=dtypes.INT64)
+    with pytest.raises(TypeError):
+        Vector.new_from_values(np.array([0, 1.7]), np.array([1, 2]), size=3)
+    with pytest.raises(OverflowError):
+        Vector.new_from_values(np.array([0, -1]), np.array([1, 2]), size=3)
 
 def test_clear(v):
     v.clear()
@@ -76,13 +100,62 @@ def test_rebuild(v):
     assert v.nvals == 4
     v.rebuild_from_values([0, 6], [1, 2])
     assert v.nvals == 2
+    v.rebuild_from_values(np.array([1, 5]), np.array([3, 4]))
+    assert v.nvals == 2
+    assert v.element[5] == 4
     with pytest.raises(IndexOutOfBound):
         v.rebuild_from_values([0, 11], [1, 1])
 
+def test_bulk_assign(v):
+    v.bulk_assign([0, 3], [5, 7])
+    assert v == Vector.new_from_values([0,1,3,4,6], [5,1,7,2,0])
+    v.bulk_assign(np.array([2, 2]), np.array([1, 2]), dup_op=BinaryOp.PLUS)
+    assert v == Vector.new_from_values([0,1,2,3,4,6], [5,1,3,7,2,0])
+    with pytest.raises(ValueError):
+        v.bulk_assign([5, 5], [1, 1])
+
 def test_extract_values(v):
     idx, vals = v.to_values()
     assert tuple(idx) == (1, 3, 4, 6)
     assert tuple(vals) == (1, 1, 2, 0)
+    assert idx.dtype == np.uint64
+    assert vals.dtype == np.int64
+
+def test_extract_values_roundtrip(v):
+    # NumPy scalars from to_values are accepted as indices and values
+    idx, vals = v.to_values()
+    assert v.element[idx[1]] == 1
+    w = v.extract[idx[:2]].new()
+    assert w == Vector.new_from_values([0, 1], [1, 1])
+    v.assign[idx[0]] = vals[2]
+    assert v.element[1] == 2
+    v.assign[[0, 2]] = np.bool_(True)
+    assert v.element[0] == 1
+
+def test_invalid_index(v):
+    with pytest.raises(TypeError):
+        v.extract[[0, 1.7]]
+    with pytest.raises(TypeError):
+        v.extract[np.array([0, 1.7])]
+    with pytest.raises(TypeError):
+        # Boolean masks are not index arrays
+        v.extract[np.array([True, False, True])]
+    with pytest.raises(TypeError):
+        v.assign['a'] = 1
+    with pytest.raises(TypeError):
+        v.rebuild_from_values(np.array([1, 5]), np.array([0.5, 4.7]))
+
+def test_freed_without_gc():
+    # Helper objects must not create a reference cycle with the Vector
+    import weakref
+    u = Vector.new_from_type(dtypes.INT64, 3)
+    u.element[0] = 1
+    u.assign[1] = 2
+    u2 = u.extract[[0, 1]].new()
+    ref = weakref.ref(u)
+    del u
+    assert ref() is None
+    assert u2.nvals == 2
 
 def test_extract_element(v):
     assert v.element[1] == 1
@@ -184,6 +257,10 @@ def test_extract(v):
     assert w == result
     w2 = v.extract[1::2].new()
     assert w2 == w
+    w[:] = v.extract[np.array([1,3,5])]
+    assert w == result
+    w3 = v.extract[::-1].new()
+    assert w3 == Vector.new_from_values([0,2,3,5], [0,2,1,1])
 
 def test_assign(v):
     u = Vector.new_from_values([0,2], [9, 8])
@@ -238,6 +315,19 @@ def test_equal(v):
     assert u2 != v
     u3 = Vector.new_from_values([1,3,4,6], [1.,1.,2.,0.])
     assert u3 != v, 'different datatypes are not equal'
+    u4 = Vector.new_from_existing(v)
+    assert (u4 == v) is True
+
+def test_equal_large():
+    # Large vectors are compared using GraphBLAS rather than NumPy
+    indices = np.arange(0, 4000, 2)
+    u = Vector.new_from_values(indices, np.ones(len(indices)), size=4000)
+    u2 = Vector.new_from_values(indices, np.ones(len(indices)), size=4000)
+    assert (u == u2) is True
+    u2.element[10] = 2.0
+    assert u != u2
+    u3 = Vector.new_from_values(indices + 1, np.ones(len(indices)), size=4000)
+    assert u != u3
 
 def test_binary_op(v):
     v2 = Vector.new_from_existing(v)